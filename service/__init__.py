@@ -8,13 +8,15 @@ import sys
 from flask import Flask
 from service import config
 from service.common import log_handlers
-from flask_talisman import Talisman
+from service.common.security import CachedPolicyTalisman
 from flask_cors import CORS
 
 # Create Flask application
 app = Flask(__name__)
 app.config.from_object(config)
-talisman = Talisman(app)
+talisman = CachedPolicyTalisman()
+if not app.config["TESTING"]:
+    talisman.init_app(app)
 CORS(app)
 
 # Import the routes After the Flask app is created
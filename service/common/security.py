@@ -0,0 +1,39 @@
+"""
+Security Headers
+
+This module contains a Talisman extension that renders its policy
+headers once instead of on every response
+"""
+import flask
+from flask_talisman import Talisman
+
+
+class CachedPolicyTalisman(Talisman):
+    """Talisman that renders each Content-Security-Policy only once"""
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, app=None, **kwargs):
+        self._rendered_policies = {}
+        super().__init__(app, **kwargs)
+
+    def _parse_policy(self, policy):
+        """Returns the header string for a policy, rendering it on first use"""
+        # A nonce is different on every request so the policy can't be reused
+        if getattr(flask.request, "csp_nonce", None):
+            return super()._parse_policy(policy)
+        # Key on the policy's content so in-place edits are picked up
+        key = policy_key(policy)
+        if key not in self._rendered_policies:
+            self._rendered_policies[key] = super()._parse_policy(policy)
+        return self._rendered_policies[key]
+
+
+def policy_key(policy):
+    """Returns a hashable copy of a policy string or dictionary"""
+    if isinstance(policy, str):
+        return policy
+    return tuple(
+        (section, content if isinstance(content, str) else tuple(content))
+        for section, content in policy.items()
+    )
@@ -19,5 +19,9 @@ if not DATABASE_URI:
 SQLALCHEMY_DATABASE_URI = DATABASE_URI
 SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+# Testing mode turns off Talisman, which means no HTTPS redirect and no
+# security headers. Only the test suite should set this, never a deployment.
+TESTING = os.getenv("TESTING", "False").lower() == "true"
+
 # Secret for session management
 SECRET_KEY = os.getenv("SECRET_KEY", "s3cr3t-key-shhhh")
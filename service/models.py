@@ -40,6 +40,17 @@ class PersistentBase:
         db.session.add(self)
         db.session.commit()
 
+    @classmethod
+    def bulk_create(cls, records):
+        """
+        Creates several Accounts in the database with a single commit
+        """
+        logger.info("Creating %d records", len(records))
+        for record in records:
+            record.id = None  # id must be none to generate next primary key
+        db.session.add_all(records)
+        db.session.commit()
+
     def update(self):
         """
         Updates a Account to the database
@@ -60,6 +60,28 @@ def create_accounts():
         jsonify(message), status.HTTP_201_CREATED, {"Location": location_url}
     )
 
+######################################################################
+# CREATE ACCOUNTS IN BULK
+######################################################################
+
+
+@app.route("/accounts/bulk", methods=["POST"])
+def bulk_create_accounts():
+    """
+    Creates several Accounts
+    This endpoint will create an Account for each item in the posted list
+    in a single database transaction
+    """
+    app.logger.info("Request to create Accounts in bulk")
+    check_content_type("application/json")
+    data = request.get_json()
+    if not isinstance(data, list):
+        abort(status.HTTP_400_BAD_REQUEST, "Request body must be a list of Accounts")
+    accounts = [Account().deserialize(item) for item in data]
+    Account.bulk_create(accounts)
+    message = [account.serialize() for account in accounts]
+    return jsonify(message), status.HTTP_201_CREATED
+
 ######################################################################
 # LIST ALL ACCOUNTS
 ######################################################################
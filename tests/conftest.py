@@ -0,0 +1,151 @@
+"""
+Shared pytest configuration for the test suite
+
+When the suite runs under pytest-xdist every worker gets its own
+database so that tests running in parallel cannot see each other's rows.
+"""
+import os
+import logging
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import NullPool
+
+# Unit tests run against an in-memory SQLite database unless DATABASE_URI
+# points them at a real server (see "make test-postgres")
+DATABASE_URI = os.getenv("DATABASE_URI", "sqlite:///:memory:")
+
+# Drop log records before they are formatted, the tests never read them
+logging.disable(logging.CRITICAL)
+logging.getLogger("sqlalchemy.engine").setLevel(logging.ERROR)
+
+
+######################################################################
+#  P E R   W O R K E R   D A T A B A S E
+######################################################################
+def worker_database_uri(uri, worker):
+    """Returns the database URI to use for the given xdist worker"""
+    url = make_url(uri)
+    if not worker:
+        return uri
+    if url.drivername.startswith("postgresql"):
+        url = url.set(database=f"{url.database}_{worker}")
+    elif url.drivername.startswith("sqlite") and url.database not in (None, "", ":memory:"):
+        # an in-memory database is already private to the worker process
+        root, ext = os.path.splitext(url.database)
+        url = url.set(database=f"{root}_{worker}{ext}")
+    else:
+        return uri
+    return url.render_as_string(hide_password=False)
+
+
+def create_database(admin_uri, uri):
+    """Creates the database named in uri if it does not exist yet"""
+    name = make_url(uri).database
+    engine = create_engine(admin_uri, isolation_level="AUTOCOMMIT")
+    with engine.connect() as connection:
+        exists = connection.execute(
+            text("SELECT 1 FROM pg_database WHERE datname = :name"), {"name": name}
+        ).scalar()
+        if not exists:
+            connection.execute(text(f'CREATE DATABASE "{name}"'))
+    engine.dispose()
+
+
+def pytest_configure(config):  # pylint: disable=unused-argument
+    """Points this worker at its own database before the app is imported"""
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    uri = worker_database_uri(DATABASE_URI, worker)
+    if uri != DATABASE_URI and uri.startswith("postgresql"):
+        create_database(DATABASE_URI, uri)
+    # service.config and the test modules read these when they are imported
+    os.environ["DATABASE_URI"] = uri
+    os.environ["TESTING"] = "True"
+
+
+######################################################################
+#  D A T A B A S E   F I X T U R E S
+######################################################################
+@pytest.fixture(scope="session")
+def database():
+    """Initializes the app and creates the tables once per test session"""
+    # pylint: disable=import-outside-toplevel
+    # Imported here so the app picks up the DATABASE_URI set above
+    from service import app
+    from service.models import db, init_db
+
+    app.config["TESTING"] = True
+    app.config["DEBUG"] = False
+    app.config["SQLALCHEMY_DATABASE_URI"] = os.environ["DATABASE_URI"]
+    init_db(app)
+    # start from empty tables, a file or server database may hold old rows
+    db.drop_all()
+    db.create_all()
+    yield db
+    db.session.remove()
+
+
+@pytest.fixture(scope="session")
+def db_connection(database):  # pylint: disable=redefined-outer-name
+    """A single connection kept open for every test in the session"""
+    if database.engine.dialect.name == "sqlite":
+        # The in-memory database only exists on the app's StaticPool connection
+        engine = database.engine
+    else:
+        # Nothing else checks out from this engine, so skip the pool
+        engine = create_engine(database.engine.url, poolclass=NullPool)
+    connection = engine.connect()
+    yield connection
+    connection.close()
+    if engine is not database.engine:
+        engine.dispose()
+
+
+@pytest.fixture
+def db_session(database, db_connection):  # pylint: disable=redefined-outer-name
+    """Runs a test inside a transaction that is rolled back afterwards"""
+    db = database
+    connection = db_connection
+    transaction = connection.begin()
+    if connection.dialect.name == "sqlite":
+        # pysqlite defers BEGIN until the first write, which lets the first
+        # SAVEPOINT act as the outer transaction, so emit BEGIN ourselves
+        connection.connection.dbapi_connection.isolation_level = None
+        connection.exec_driver_sql("BEGIN")
+    session = db.create_scoped_session(options={"bind": connection, "binds": {}})
+    savepoint = connection.begin_nested()
+
+    # The code under test calls commit(), which ends the savepoint, so
+    # start a new one to keep everything inside the outer transaction
+    @event.listens_for(session, "after_transaction_end")
+    def restart_savepoint(_session, _transaction):
+        nonlocal savepoint
+        if not savepoint.is_active:
+            savepoint = connection.begin_nested()
+
+    original_session = db.session
+    db.session = session
+    yield session
+    db.session = original_session
+    session.remove()
+    transaction.rollback()
+    if connection.dialect.name == "sqlite":
+        connection.connection.dbapi_connection.isolation_level = ""
+
+
+@pytest.fixture(scope="session")
+def client(database):  # pylint: disable=redefined-outer-name,unused-argument
+    """A Flask test client shared by every test in the session"""
+    # pylint: disable=import-outside-toplevel
+    from service import app
+
+    return app.test_client()
+
+
+@pytest.fixture(scope="session")
+def account_payloads():
+    """Serialized fake accounts built once and shared by every test"""
+    # pylint: disable=import-outside-toplevel
+    from tests.factories import AccountFactory
+
+    return [account.serialize() for account in AccountFactory.build_batch(64)]